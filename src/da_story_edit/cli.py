@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import argparse
 import json
+import os
 import secrets
 import sys
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
 from difflib import unified_diff
 from html import escape
@@ -10,11 +14,16 @@ from pathlib import Path
 import re
 from typing import Callable, TypeVar, cast
 import unicodedata
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
 import httpx
 
-from da_story_edit.da_api import DeviantArtApiClient, slugify_name
+from da_story_edit.da_api import (
+    DeviantArtApiClient,
+    GalleryFolder,
+    looks_like_invalid_token,
+    slugify_name,
+)
 from da_story_edit.config import (
     AuthTokenExpiredError,
     ConfigError,
@@ -22,13 +31,18 @@ from da_story_edit.config import (
     load_required_config,
     upsert_env_values,
 )
+from da_story_edit.folder_cache import (
+    default_folder_cache_dir,
+    load_cached_folders,
+    store_cached_folders,
+)
 from da_story_edit.gallery import (
     DeviationSummary,
     GalleryTarget,
     parse_gallery_target,
 )
 from da_story_edit.http_client import API_PROFILE, ThrottledHttpClient
-from da_story_edit.navigation import NavTargets, apply_navigation
+from da_story_edit.navigation import apply_navigation, build_nav_targets
 from da_story_edit.options import build_parser
 
 AUTHORIZE_ENDPOINT = "https://www.deviantart.com/oauth2/authorize"
@@ -44,16 +58,14 @@ T = TypeVar("T")
 def _build_authorize_url(
     client_id: str, redirect_uri: str, scopes: str, state: str
 ) -> str:
-    query = urlencode(
-        {
-            "response_type": "code",
-            "client_id": client_id,
-            "redirect_uri": redirect_uri,
-            "scope": scopes,
-            "state": state,
-        }
+    # Encoded exactly as urlencode() would encode the same pairs.
+    return (
+        f"{AUTHORIZE_ENDPOINT}?response_type=code"
+        f"&client_id={quote_plus(client_id)}"
+        f"&redirect_uri={quote_plus(redirect_uri)}"
+        f"&scope={quote_plus(scopes)}"
+        f"&state={quote_plus(state)}"
     )
-    return f"{AUTHORIZE_ENDPOINT}?{query}"
 
 
 def _token_request(
@@ -133,37 +145,86 @@ def _validate_access_token(access_token: str, http_client: ThrottledHttpClient)
         )
         response.raise_for_status()
     except httpx.HTTPError as exc:
+        body = ""
         if isinstance(exc, httpx.HTTPStatusError):
-            if _looks_like_invalid_token(exc.response):
+            if looks_like_invalid_token(exc.response):
                 raise AuthTokenExpiredError(
                     "Access token is invalid or expired."
                 ) from exc
-        body = ""
-        if isinstance(exc, httpx.HTTPStatusError):
             snippet = exc.response.text[:300].replace("\n", " ")
             body = f" Response body: {snippet}"
         raise ConfigError(f"Access token validation failed.{body}") from exc
 
 
+def _list_folders(
+    client: DeviantArtApiClient,
+    username: str,
+    *,
+    cache_dir: Path | None,
+    refresh: bool,
+) -> tuple[list[GalleryFolder], bool]:
+    """Return (folders, from_cache), consulting the on-disk folder cache first."""
+    if cache_dir is not None and not refresh:
+        cached = load_cached_folders(cache_dir, username)
+        if cached is not None:
+            return cached, True
+    folders = client.list_folders(username)
+    if cache_dir is not None:
+        store_cached_folders(cache_dir, username, folders)
+    return folders, False
+
+
+def _find_folder_by_slug(
+    folders: list[GalleryFolder], folder_slug: str
+) -> GalleryFolder | None:
+    wanted = slugify_name(folder_slug)
+    return next(
+        (folder for folder in folders if slugify_name(folder.name) == wanted), None
+    )
+
+
 def _resolve_gallery_deviations(
     access_token: str,
     gallery_input: str,
     http_client: ThrottledHttpClient,
+    *,
+    client: DeviantArtApiClient | None = None,
+    folder_cache_dir: Path | None = None,
+    refresh_folders: bool = False,
 ) -> tuple[GalleryTarget, list[DeviationSummary], str | None, str]:
+    """Resolve gallery input to ordered deviations.
+
+    When `client` is given it is reused (with `access_token` applied in place)
+    so callers can keep using the same client after resolution.
+    """
     target = parse_gallery_target(gallery_input)
-    client = DeviantArtApiClient(
-        access_token=access_token,
-        user_agent=USER_AGENT,
-        http_client=http_client,
-    )
+    if client is None:
+        client = DeviantArtApiClient(
+            access_token=access_token,
+            user_agent=USER_AGENT,
+            http_client=http_client,
+        )
+    else:
+        client.access_token = access_token
 
     deviations: list[DeviationSummary] = []
     resolved_folder_id: str | None = None
     workspace_label = target.username
-    folders = client.list_folders(target.username) if target.folder_slug else []
+    folders: list[GalleryFolder] = []
     if target.folder_slug:
-        folder_map = {slugify_name(folder.name): folder for folder in folders}
-        match = folder_map.get(slugify_name(target.folder_slug))
+        folders, from_cache = _list_folders(
+            client,
+            target.username,
+            cache_dir=folder_cache_dir,
+            refresh=refresh_folders,
+        )
+        match = _find_folder_by_slug(folders, target.folder_slug)
+        if not match and from_cache:
+            # The folder may be newer than the cache entry; re-check live once.
+            folders, _ = _list_folders(
+                client, target.username, cache_dir=folder_cache_dir, refresh=True
+            )
+            match = _find_folder_by_slug(folders, target.folder_slug)
         if match:
             candidate = client.list_gallery(
                 username=target.username,
@@ -177,7 +238,12 @@ def _resolve_gallery_deviations(
 
     if not deviations and target.folder_ref:
         if not folders:
-            folders = client.list_folders(target.username)
+            folders, _ = _list_folders(
+                client,
+                target.username,
+                cache_dir=folder_cache_dir,
+                refresh=refresh_folders,
+            )
         folder_by_id = {folder.folder_id: folder for folder in folders}
         candidate = client.list_gallery(
             username=target.username,
@@ -208,8 +274,9 @@ def _ensure_empty_workdir(path: Path) -> Path:
     if path.exists():
         if not path.is_dir():
             raise ConfigError(f"Workdir path exists and is not a directory: {path}")
-        if any(path.iterdir()):
-            raise ConfigError(f"Workdir must be empty: {path}")
+        with os.scandir(path) as entries:
+            if next(entries, None) is not None:
+                raise ConfigError(f"Workdir must be empty: {path}")
     else:
         path.mkdir(parents=True, exist_ok=False)
     return path
@@ -228,22 +295,6 @@ def _default_gallery_workdir(label: str) -> Path:
     return Path("galleries") / _slugify_path_name(label)
 
 
-def _looks_like_invalid_token(response: httpx.Response) -> bool:
-    if response.status_code in {401, 403}:
-        text = response.text.lower()
-        if "invalid_token" in text or "expired" in text:
-            return True
-        try:
-            payload = response.json()
-        except Exception:
-            return False
-        if isinstance(payload, dict):
-            err = str(payload.get("error") or "").lower()
-            desc = str(payload.get("error_description") or "").lower()
-            return "invalid_token" in err or "expired" in desc
-    return False
-
-
 def _html_from_fulltext_markup(payload: dict[str, object]) -> str:
     text_content = payload.get("text_content")
     if not isinstance(text_content, dict):
@@ -274,6 +325,27 @@ def _html_from_fulltext_markup(payload: dict[str, object]) -> str:
     return "\n".join(lines)
 
 
+def _fetch_fulltext_metadata(
+    client: DeviantArtApiClient,
+    items: list[DeviationSummary],
+    jobs: int,
+) -> Iterator[dict[str, object] | ConfigError]:
+    """Fetch fulltext metadata for items with up to `jobs` requests in flight.
+
+    Results are yielded in input order. Per-item API failures are yielded as
+    the raised ConfigError so the caller can report them and continue.
+    """
+
+    def fetch(item: DeviationSummary) -> dict[str, object] | ConfigError:
+        try:
+            return client.get_deviation(item.deviation_id, expand="deviation.fulltext")
+        except ConfigError as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(fetch, items)
+
+
 def _manifest_path(workdir: Path) -> Path:
     return workdir / "manifest.json"
 
@@ -298,6 +370,12 @@ def _write_manifest(workdir: Path, manifest: dict[str, object]) -> None:
     )
 
 
+def _dump_metadata(metadata: dict[str, object], *, pretty: bool) -> str:
+    if pretty:
+        return json.dumps(metadata, indent=2, sort_keys=True)
+    return json.dumps(metadata, separators=(",", ":"), sort_keys=True)
+
+
 def _manifest_items(manifest: dict[str, object]) -> list[dict[str, object]]:
     raw_items = manifest.get("items")
     if not isinstance(raw_items, list):
@@ -315,6 +393,33 @@ def _item_base_name(idx: int, deviation_id: str) -> str:
     return f"{idx:03d}_{safe_id}"
 
 
+def _atomic_write_text(path: Path, data: str) -> None:
+    """Write data next to path and rename it into place in one step."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(data, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _write_diff(
+    path: Path,
+    original_lines: list[str],
+    updated_lines: list[str],
+    *,
+    fromfile: str,
+    tofile: str,
+) -> None:
+    """Stream a unified diff to path line by line instead of joining it first."""
+    with path.open("w", encoding="utf-8") as handle:
+        for line in unified_diff(
+            original_lines,
+            updated_lines,
+            fromfile=fromfile,
+            tofile=tofile,
+            lineterm="",
+        ):
+            handle.write(f"{line}\n")
+
+
 def _run_with_optional_refresh(
     env_path: Path,
     operation: Callable[[str], T],
@@ -399,8 +504,16 @@ def run(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
     env_path = Path(".env")
-    http_client = ThrottledHttpClient(user_agent=USER_AGENT)
+    with ThrottledHttpClient(user_agent=USER_AGENT) as http_client:
+        return _dispatch(parser, args, env_path, http_client)
+
 
+def _dispatch(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    env_path: Path,
+    http_client: ThrottledHttpClient,
+) -> int:
     if args.command is None:
         load_required_config(
             ["DA_CLIENT_ID", "DA_CLIENT_SECRET", "DA_REDIRECT_URI"], env_path
@@ -467,9 +580,9 @@ def run(argv: list[str] | None = None) -> int:
         cfg = load_config(env_path)
 
         known_scope = (cfg.get("DA_OAUTH_SCOPE") or "").strip()
-        scope_tokens = {token for token in known_scope.split() if token}
-        has_browse = "browse" in scope_tokens
-        has_user_manage = "user.manage" in scope_tokens
+        scopes = known_scope.split()
+        has_browse = "browse" in scopes
+        has_user_manage = "user.manage" in scopes
 
         print("Access token is valid.")
         if known_scope:
@@ -488,10 +601,20 @@ def run(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "gallery" and args.gallery_command == "list":
+        client = DeviantArtApiClient(
+            access_token="",
+            user_agent=USER_AGENT,
+            http_client=http_client,
+        )
         result, _ = _run_with_optional_refresh(
             env_path,
             lambda access_token: _resolve_gallery_deviations(
-                access_token, args.gallery, http_client
+                access_token,
+                args.gallery,
+                http_client,
+                client=client,
+                folder_cache_dir=default_folder_cache_dir(),
+                refresh_folders=args.refresh_folders,
             ),
             http_client,
         )
@@ -520,10 +643,20 @@ def run(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "gallery" and args.gallery_command == "download":
-        result, refreshed = _run_with_optional_refresh(
+        client = DeviantArtApiClient(
+            access_token="",
+            user_agent=USER_AGENT,
+            http_client=http_client,
+        )
+        result, _ = _run_with_optional_refresh(
             env_path,
             lambda access_token: _resolve_gallery_deviations(
-                access_token, args.gallery, http_client
+                access_token,
+                args.gallery,
+                http_client,
+                client=client,
+                folder_cache_dir=default_folder_cache_dir(),
+                refresh_folders=args.refresh_folders,
             ),
             http_client,
         )
@@ -541,18 +674,6 @@ def run(argv: list[str] | None = None) -> int:
         else:
             workdir = _ensure_empty_workdir(_default_gallery_workdir(workspace_label))
 
-        cfg = load_config(env_path)
-        access_token = cfg.get("DA_ACCESS_TOKEN") or ""
-        if refreshed:
-            access_token = load_required_config(["DA_ACCESS_TOKEN"], env_path)[
-                "DA_ACCESS_TOKEN"
-            ]
-        client = DeviantArtApiClient(
-            access_token=access_token,
-            user_agent=USER_AGENT,
-            http_client=http_client,
-        )
-
         failed_count = 0
         downloaded_count = 0
         print(f"Gallery workdir: {workdir}")
@@ -561,50 +682,59 @@ def run(argv: list[str] | None = None) -> int:
             print(f"Folder: {resolved_folder_id}")
         print(f"Order: {args.order}")
         print(f"Literature items: {len(literature)}")
+        print(f"Fetch jobs: {args.jobs}")
         print("Mode: download")
 
         manifest_items: list[dict[str, object]] = []
 
-        for idx, item in enumerate(literature, start=1):
-            try:
-                metadata = client.get_deviation(
-                    item.deviation_id, expand="deviation.fulltext"
+        pending_writes: list[Future[None]] = []
+        with ThreadPoolExecutor(max_workers=2) as writer:
+            fetched = _fetch_fulltext_metadata(client, literature, args.jobs)
+            for idx, (item, metadata) in enumerate(zip(literature, fetched), start=1):
+                if isinstance(metadata, ConfigError):
+                    failed_count += 1
+                    print(
+                        f"{idx:03d} {item.title} [{item.deviation_id}] failed=fetch_error details={metadata}"
+                    )
+                    continue
+
+                html = _html_from_fulltext_markup(metadata)
+                if not html.strip():
+                    failed_count += 1
+                    print(
+                        f"{idx:03d} {item.title} [{item.deviation_id}] failed=empty_content "
+                        "details=no body markup in /deviation/{uuid}?expand=deviation.fulltext"
+                    )
+                    continue
+
+                base = _item_base_name(idx, item.deviation_id)
+                pending_writes.append(
+                    writer.submit(
+                        _atomic_write_text,
+                        workdir / f"{base}_meta.json",
+                        _dump_metadata(metadata, pretty=args.pretty),
+                    )
                 )
-            except ConfigError as exc:
-                failed_count += 1
-                print(
-                    f"{idx:03d} {item.title} [{item.deviation_id}] failed=fetch_error details={exc}"
+                pending_writes.append(
+                    writer.submit(
+                        _atomic_write_text, workdir / f"{base}_original.html", html
+                    )
                 )
-                continue
-
-            html = _html_from_fulltext_markup(metadata)
-            if not html.strip():
-                failed_count += 1
-                print(
-                    f"{idx:03d} {item.title} [{item.deviation_id}] failed=empty_content "
-                    "details=no body markup in /deviation/{uuid}?expand=deviation.fulltext"
+                manifest_items.append(
+                    {
+                        "index": idx,
+                        "deviation_id": item.deviation_id,
+                        "title": item.title,
+                        "url": item.url,
+                        "kind": item.kind,
+                        "base_name": base,
+                    }
                 )
-                continue
+                downloaded_count += 1
+                print(f"{idx:03d} {item.title} [{item.deviation_id}] downloaded=yes")
 
-            base = _item_base_name(idx, item.deviation_id)
-            (workdir / f"{base}_meta.json").write_text(
-                json.dumps(metadata, indent=2, sort_keys=True), encoding="utf-8"
-            )
-            (workdir / f"{base}_original.html").write_text(html, encoding="utf-8")
-            manifest_items.append(
-                {
-                    "index": idx,
-                    "deviation_id": item.deviation_id,
-                    "title": item.title,
-                    "url": item.url,
-                    "kind": item.kind,
-                    "base_name": base,
-                }
-            )
-            downloaded_count += 1
-            print(
-                f"{idx:03d} {item.title} [{item.deviation_id}] downloaded=yes"
-            )
+        for pending in pending_writes:
+            pending.result()
 
         manifest = {
             "schema_version": 1,
@@ -639,6 +769,7 @@ def run(argv: list[str] | None = None) -> int:
         urls = [str(item.get("url") or "").strip() for item in items]
         if any(not url for url in urls):
             raise ConfigError("Manifest contains an item with a missing URL.")
+        nav_targets = build_nav_targets(urls)
 
         for idx, item in enumerate(items, start=1):
             deviation_id = str(item.get("deviation_id") or "").strip()
@@ -654,28 +785,26 @@ def run(argv: list[str] | None = None) -> int:
                 continue
 
             html = original_path.read_text(encoding="utf-8")
-            targets = NavTargets(
-                first=urls[0],
-                prev=urls[idx - 2] if idx > 1 else None,
-                next=urls[idx] if idx < len(urls) else None,
-                last=urls[-1],
-            )
-            updated = apply_navigation(html, targets)
-            changed = updated != (html if html.endswith("\n") else f"{html}\n")
-
-            (workdir / f"{base}_updated.html").write_text(updated, encoding="utf-8")
-            diff = "\n".join(
-                unified_diff(
-                    (html or "").splitlines(),
-                    updated.splitlines(),
+            updated = apply_navigation(html, nav_targets[idx - 1])
+            html_lines = html.splitlines()
+            updated_lines = updated.splitlines()
+            changed = html_lines != updated_lines
+
+            updated_path = workdir / f"{base}_updated.html"
+            diff_path = workdir / f"{base}.diff"
+            if changed:
+                updated_path.write_text(updated, encoding="utf-8")
+                _write_diff(
+                    diff_path,
+                    html_lines,
+                    updated_lines,
                     fromfile=f"{base}_original.html",
                     tofile=f"{base}_updated.html",
-                    lineterm="",
                 )
-            )
-            (workdir / f"{base}.diff").write_text(
-                diff + ("\n" if diff else ""), encoding="utf-8"
-            )
+            else:
+                # Unchanged items get no artifacts; drop leftovers from earlier links.
+                updated_path.unlink(missing_ok=True)
+                diff_path.unlink(missing_ok=True)
 
             print(f"{idx:03d} {title} [{deviation_id}] changed={'yes' if changed else 'no'}")
             if changed:
@@ -694,14 +823,17 @@ def run(argv: list[str] | None = None) -> int:
         if not items:
             raise ConfigError("Manifest contains no items to upload.")
 
+        client = DeviantArtApiClient(
+            access_token="",
+            user_agent=USER_AGENT,
+            http_client=http_client,
+        )
+
         def _upload_operation(access_token: str) -> tuple[int, int]:
-            client = DeviantArtApiClient(
-                access_token=access_token,
-                user_agent=USER_AGENT,
-                http_client=http_client,
-            )
+            client.access_token = access_token
             uploaded_count = 0
             failed_count = 0
+            linked = bool(manifest.get("linked_at"))
 
             print(f"Gallery workdir: {workdir}")
             print("Mode: upload")
@@ -728,6 +860,10 @@ def run(argv: list[str] | None = None) -> int:
                     print(f"{idx:03d} {title} [{deviation_id}] failed=missing_original")
                     continue
                 if not updated_path.exists():
+                    if linked:
+                        # `gallery link` only writes *_updated.html for changed items.
+                        print(f"{idx:03d} {title} [{deviation_id}] changed=no")
+                        continue
                     failed_count += 1
                     print(f"{idx:03d} {title} [{deviation_id}] failed=missing_updated")
                     continue
@@ -739,12 +875,13 @@ def run(argv: list[str] | None = None) -> int:
                 if not isinstance(metadata, dict):
                     raise ConfigError(f"Metadata has unexpected shape: {meta_path}")
 
-                original_html = original_path.read_text(encoding="utf-8")
-                updated_html = updated_path.read_text(encoding="utf-8")
-                changed = updated_html != (
-                    original_html
-                    if original_html.endswith("\n")
-                    else f"{original_html}\n"
+                # Compare raw bytes; only bodies that are uploaded get decoded.
+                original_raw = original_path.read_bytes()
+                updated_raw = updated_path.read_bytes()
+                changed = updated_raw != (
+                    original_raw
+                    if original_raw.endswith(b"\n")
+                    else original_raw + b"\n"
                 )
                 print(f"{idx:03d} {title} [{deviation_id}] changed={'yes' if changed else 'no'}")
                 if not changed:
@@ -753,7 +890,7 @@ def run(argv: list[str] | None = None) -> int:
                 client.update_literature(
                     deviation_id=deviation_id,
                     title=str(metadata.get("title") or title),
-                    body_html=updated_html,
+                    body_html=updated_raw.decode("utf-8"),
                     is_mature=bool(metadata.get("is_mature")),
                 )
                 uploaded_count += 1
@@ -4,8 +4,6 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 
-from dotenv import dotenv_values, load_dotenv
-
 
 @dataclass(frozen=True)
 class ConfigVar:
@@ -52,6 +50,11 @@ CONFIG_REGISTRY: tuple[ConfigVar, ...] = (
 )
 
 
+_ENV_FILE_CACHE: dict[Path, tuple[tuple[int, int], dict[str, str]]] = {}
+# Files already bootstrapped and exported to os.environ, by (mtime_ns, size).
+_BOOTSTRAPPED_ENV_FILES: dict[Path, tuple[int, int]] = {}
+
+
 class ConfigError(RuntimeError):
     """Raised when required environment configuration is missing."""
 
@@ -60,6 +63,60 @@ class AuthTokenExpiredError(ConfigError):
     """Raised when API reports an expired or invalid access token."""
 
 
+def _env_file_stamp(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parse_env_file(path: Path) -> dict[str, str]:
+    """Parse KEY=value lines; blank lines and # comments are skipped.
+
+    Values are opaque tokens: no interpolation or escapes. A single pair of
+    matching surrounding quotes is removed.
+    """
+    values: dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        key, sep, value = stripped.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        values[key] = value
+    return values
+
+
+def _read_env_file(env_path: Path) -> dict[str, str]:
+    """Parse env_path, reusing the previous parse while the file is unchanged.
+
+    Entries are keyed by resolved path and invalidated when the file's
+    mtime or size changes. Callers must treat the result as read-only.
+    """
+    path = env_path.resolve()
+    stamp = _env_file_stamp(path)
+    cached = _ENV_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    parsed = _parse_env_file(path)
+    _ENV_FILE_CACHE[path] = (stamp, parsed)
+    return parsed
+
+
+def _invalidate_env_file(env_path: Path) -> None:
+    _ENV_FILE_CACHE.pop(env_path.resolve(), None)
+
+
+_ENV_FILE_HEADER = (
+    "# da-story-edit environment configuration",
+    "# Fill in required values before running live API operations.",
+    "",
+)
+
+
 def _render_template_entry(var: ConfigVar) -> str:
     lines = [f"# {var.description}"]
     if var.example:
@@ -77,14 +134,10 @@ def bootstrap_env_file(env_path: Path) -> list[str]:
     env_path.parent.mkdir(parents=True, exist_ok=True)
 
     if not env_path.exists():
-        header = [
-            "# da-story-edit environment configuration",
-            "# Fill in required values before running live API operations.",
-            "",
-        ]
-        env_path.write_text("\n".join(header), encoding="utf-8")
-
-    existing = dotenv_values(env_path)
+        env_path.write_text("\n".join(_ENV_FILE_HEADER), encoding="utf-8")
+        _invalidate_env_file(env_path)
+
+    existing = _read_env_file(env_path)
     added: list[str] = []
     blocks: list[str] = []
 
@@ -99,6 +152,7 @@ def bootstrap_env_file(env_path: Path) -> list[str]:
         suffix = "\n" if original and not original.endswith("\n") else ""
         appended = "\n\n".join(blocks) + "\n"
         env_path.write_text(f"{original}{suffix}{appended}", encoding="utf-8")
+        _invalidate_env_file(env_path)
 
     return added
 
@@ -113,9 +167,19 @@ def load_and_validate_config(env_path: Path | None = None) -> dict[str, str]:
 
 
 def _resolve_values(env_path: Path) -> tuple[list[str], dict[str, str]]:
-    added = bootstrap_env_file(env_path)
-    load_dotenv(env_path)
-    parsed = dotenv_values(env_path)
+    path = env_path.resolve()
+    stamp = _BOOTSTRAPPED_ENV_FILES.get(path)
+    if stamp is not None and path.exists() and _env_file_stamp(path) == stamp:
+        # Unchanged since the last resolve: nothing to bootstrap or export.
+        added: list[str] = []
+        parsed = _read_env_file(path)
+    else:
+        added = bootstrap_env_file(env_path)
+        parsed = _read_env_file(env_path)
+        # File values are defaults only: never override the process env.
+        for key, file_value in parsed.items():
+            os.environ.setdefault(key, file_value)
+        _BOOTSTRAPPED_ENV_FILES[path] = _env_file_stamp(path)
 
     resolved: dict[str, str] = {}
     for var in CONFIG_REGISTRY:
@@ -158,18 +222,22 @@ def load_required_config(
 def upsert_env_values(env_path: Path, updates: dict[str, str]) -> None:
     """Update or append key/value pairs in .env while preserving unrelated lines."""
     env_path.parent.mkdir(parents=True, exist_ok=True)
-    if not env_path.exists():
-        bootstrap_env_file(env_path)
-
-    lines = env_path.read_text(encoding="utf-8").splitlines()
+    if env_path.exists():
+        lines = env_path.read_text(encoding="utf-8").splitlines()
+    else:
+        # Same content bootstrap_env_file() would write, built in memory.
+        template = "\n".join(_ENV_FILE_HEADER) + "\n\n".join(
+            _render_template_entry(var) for var in CONFIG_REGISTRY
+        )
+        lines = template.splitlines()
     index_by_key: dict[str, int] = {}
 
     for idx, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#") or "=" not in line:
+        if line.lstrip()[:1] in ("", "#"):
             continue
-        key = line.split("=", 1)[0].strip()
-        if key:
+        key, sep, _ = line.partition("=")
+        key = key.strip()
+        if sep and key:
             index_by_key[key] = idx
 
     for key, value in updates.items():
@@ -182,3 +250,4 @@ def upsert_env_values(env_path: Path, updates: dict[str, str]) -> None:
             lines.append(new_line)
 
     env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    _invalidate_env_file(env_path)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import json
-import re
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import cast
+from typing import Self, cast
 
 import httpx
 
@@ -13,6 +13,12 @@ from da_story_edit.gallery import DeviationSummary, parse_gallery_results
 from da_story_edit.http_client import API_PROFILE, ThrottledHttpClient
 
 API_BASE = "https://www.deviantart.com/api/v1/oauth2"
+_TOKEN_ERROR_SCAN_CHARS = 400
+
+# Keeps ASCII letters (lowercased) and digits; every other ASCII char is dropped.
+_SLUG_TABLE: dict[int, str | None] = {
+    code: chr(code).lower() if chr(code).isalnum() else None for code in range(128)
+}
 
 
 @dataclass(frozen=True)
@@ -23,8 +29,7 @@ class GalleryFolder:
 
 def slugify_name(value: str) -> str:
     normalized = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode()
-    lowered = normalized.lower()
-    return re.sub(r"[^a-z0-9]+", "", lowered)
+    return normalized.translate(_SLUG_TABLE)
 
 
 class DeviantArtApiClient:
@@ -33,25 +38,40 @@ class DeviantArtApiClient:
         access_token: str,
         user_agent: str,
         http_client: ThrottledHttpClient | None = None,
+        page_workers: int = 4,
     ) -> None:
         self.access_token = access_token
+        self.page_workers = max(1, page_workers)
+        self._owns_http_client = http_client is None
         self.http_client = http_client or ThrottledHttpClient(user_agent=user_agent)
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP client if this API client created it."""
+        if self._owns_http_client:
+            self.http_client.close()
+
     def _get(self, path: str, params: dict[str, object]) -> dict[str, object]:
-        merged = {"access_token": self.access_token}
-        merged.update(params)
         url = f"{API_BASE}{path}"
         try:
-            response = self.http_client.get(url, params=merged, profile=API_PROFILE)
+            response = self.http_client.get(
+                url,
+                params={"access_token": self.access_token, **params},
+                profile=API_PROFILE,
+            )
             response.raise_for_status()
         except httpx.HTTPError as exc:
             body = ""
             if isinstance(exc, httpx.HTTPStatusError):
-                if _looks_like_invalid_token(exc.response):
+                if looks_like_invalid_token(exc.response):
                     raise AuthTokenExpiredError(
                         "Access token is invalid or expired."
                     ) from exc
-            if isinstance(exc, httpx.HTTPStatusError):
                 snippet = exc.response.text[:300].replace("\n", " ")
                 body = f" Response body: {snippet}"
             raise ConfigError(f"API request failed for {path}.{body}") from exc
@@ -65,16 +85,18 @@ class DeviantArtApiClient:
         return payload
 
     def _post(self, path: str, data: dict[str, object]) -> dict[str, object]:
-        merged = {"access_token": self.access_token}
-        merged.update(data)
         url = f"{API_BASE}{path}"
         try:
-            response = self.http_client.post(url, data=merged, profile=API_PROFILE)
+            response = self.http_client.post(
+                url,
+                data={"access_token": self.access_token, **data},
+                profile=API_PROFILE,
+            )
             response.raise_for_status()
         except httpx.HTTPError as exc:
             body = ""
             if isinstance(exc, httpx.HTTPStatusError):
-                if _looks_like_invalid_token(exc.response):
+                if looks_like_invalid_token(exc.response):
                     raise AuthTokenExpiredError(
                         "Access token is invalid or expired."
                     ) from exc
@@ -97,35 +119,48 @@ class DeviantArtApiClient:
         *,
         mode: str = "newest",
     ) -> list[DeviationSummary]:
+        """List gallery deviations in API order.
+
+        After the first page, up to `page_workers` following pages are
+        requested concurrently at predicted `offset + n * limit` positions.
+        Pages are consumed in order; if the API reports a different
+        next_offset than predicted, the rest of that batch is dropped and
+        paging resumes from the reported offset.
+        """
         path = "/gallery/all" if folder_id is None else f"/gallery/{folder_id}"
-        offset = 0
         limit = 24
         all_items: list[DeviationSummary] = []
 
-        while True:
-            payload = self._get(
+        def fetch_page(page_offset: int) -> dict[str, object]:
+            return self._get(
                 path,
                 {
                     "username": username,
-                    "offset": offset,
+                    "offset": page_offset,
                     "limit": limit,
                     "mode": mode,
                     "mature_content": "true",
                 },
             )
-            page_items = parse_gallery_results(payload)
-            all_items.extend(page_items)
 
-            has_more = bool(payload.get("has_more"))
-            next_offset = payload.get("next_offset")
-            if not has_more:
-                break
-            if not isinstance(next_offset, int):
-                if not page_items:
-                    break
-                offset += len(page_items)
-            else:
-                offset = next_offset
+        offset: int | None = 0
+        batch_size = 1
+        with ThreadPoolExecutor(max_workers=self.page_workers) as executor:
+            while offset is not None:
+                offsets = [offset + step * limit for step in range(batch_size)]
+                expected: int | None = offset
+                for page_offset, payload in zip(
+                    offsets, executor.map(fetch_page, offsets)
+                ):
+                    if page_offset != expected:
+                        break
+                    page_items = parse_gallery_results(payload)
+                    all_items.extend(page_items)
+                    expected = _next_page_offset(payload, page_offset, len(page_items))
+                    if expected is None:
+                        break
+                offset = expected
+                batch_size = self.page_workers
         return all_items
 
     def list_folders(self, username: str) -> list[GalleryFolder]:
@@ -192,17 +227,37 @@ class DeviantArtApiClient:
         )
 
 
-def _looks_like_invalid_token(response: httpx.Response) -> bool:
-    if response.status_code in {401, 403}:
-        text = response.text.lower()
-        if "invalid_token" in text or "expired" in text:
-            return True
+def _next_page_offset(
+    payload: dict[str, object], offset: int, page_size: int
+) -> int | None:
+    """Return the offset of the page after `offset`, or None on the last page."""
+    if not payload.get("has_more"):
+        return None
+    next_offset = payload.get("next_offset")
+    if isinstance(next_offset, int):
+        return next_offset
+    if not page_size:
+        return None
+    return offset + page_size
+
+
+def looks_like_invalid_token(response: httpx.Response) -> bool:
+    """Return True if a 401/403 response reports an invalid or expired token.
+
+    JSON error bodies (DeviantArt's normal shape) are inspected field by
+    field; anything else gets a bounded scan of the start of the body.
+    """
+    if response.status_code not in {401, 403}:
+        return False
+    if "json" in response.headers.get("content-type", ""):
         try:
             payload = response.json()
-        except Exception:
-            return False
+        except ValueError:
+            payload = None
         if isinstance(payload, dict):
-            err = str(payload.get("error") or "").lower()
-            desc = str(payload.get("error_description") or "").lower()
+            payload_dict = cast(dict[str, object], payload)
+            err = str(payload_dict.get("error") or "").lower()
+            desc = str(payload_dict.get("error_description") or "").lower()
             return "invalid_token" in err or "expired" in desc
-    return False
+    text = response.text[:_TOKEN_ERROR_SCAN_CHARS].lower()
+    return "invalid_token" in text or "expired" in text
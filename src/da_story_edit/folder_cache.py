@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import cast
+
+from da_story_edit.da_api import GalleryFolder
+
+FOLDER_CACHE_TTL_SECONDS = 3600.0
+
+
+def default_folder_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "da-story-edit" / "folders"
+
+
+def _cache_path(cache_dir: Path, username: str) -> Path:
+    safe_name = re.sub(r"[^a-z0-9_-]+", "_", username.lower())
+    return cache_dir / f"{safe_name}.json"
+
+
+def load_cached_folders(
+    cache_dir: Path,
+    username: str,
+    *,
+    max_age_seconds: float = FOLDER_CACHE_TTL_SECONDS,
+    now: float | None = None,
+) -> list[GalleryFolder] | None:
+    """Return cached folders for username, or None if missing, stale, or invalid."""
+    path = _cache_path(cache_dir, username)
+    try:
+        raw = path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    try:
+        payload = json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    payload_dict = cast(dict[str, object], payload)
+
+    cached_at = payload_dict.get("cached_at")
+    raw_folders = payload_dict.get("folders")
+    if not isinstance(cached_at, (int, float)) or not isinstance(raw_folders, list):
+        return None
+    current = time.time() if now is None else now
+    if current - cached_at > max_age_seconds:
+        return None
+
+    folders: list[GalleryFolder] = []
+    for entry in raw_folders:
+        if not isinstance(entry, dict):
+            return None
+        entry_dict = cast(dict[str, object], entry)
+        folder_id = entry_dict.get("folder_id")
+        name = entry_dict.get("name")
+        if not isinstance(folder_id, str) or not isinstance(name, str):
+            return None
+        folders.append(GalleryFolder(folder_id=folder_id, name=name))
+    return folders
+
+
+def store_cached_folders(
+    cache_dir: Path,
+    username: str,
+    folders: list[GalleryFolder],
+    *,
+    now: float | None = None,
+) -> None:
+    """Persist folders for username. Cache write failures are not fatal."""
+    payload = {
+        "username": username,
+        "cached_at": time.time() if now is None else now,
+        "folders": [
+            {"folder_id": folder.folder_id, "name": folder.name} for folder in folders
+        ],
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _cache_path(cache_dir, username).write_text(
+            json.dumps(payload, indent=2) + "\n", encoding="utf-8"
+        )
+    except OSError:
+        return
@@ -8,6 +8,14 @@ import re
 from da_story_edit.config import ConfigError
 
 
+_DEVIATION_URL_RE = re.compile(r'https://www\.deviantart\.com/([^/"]+)/art/[^"]+')
+# Common gallery URL shape: /<user>/gallery[/<folder_ref>[/<slug>]][/][?query].
+_GALLERY_URL_RE = re.compile(
+    r"https?://www\.deviantart\.com/([^/?#]+)/gallery"
+    r"(?:/([^/?#]+))?(?:/([^/?#]+))?/?(?:[?#].*)?$"
+)
+
+
 @dataclass(frozen=True)
 class GalleryTarget:
     username: str
@@ -28,18 +36,15 @@ class DeviationSummary:
 
 
 def extract_gallery_deviation_urls(html: str, username: str) -> list[str]:
-    pattern = re.compile(
-        rf"https://www\.deviantart\.com/{re.escape(username)}/art/[^\"]+"
+    wanted = username.lower()
+    # dict.fromkeys() dedups while keeping first-seen order.
+    return list(
+        dict.fromkeys(
+            match.group(0)
+            for match in _DEVIATION_URL_RE.finditer(html)
+            if match.group(1).lower() == wanted
+        )
     )
-    found = pattern.findall(html)
-    ordered: list[str] = []
-    seen: set[str] = set()
-    for url in found:
-        if url in seen:
-            continue
-        seen.add(url)
-        ordered.append(url)
-    return ordered
 
 
 def parse_gallery_target(raw: str) -> GalleryTarget:
@@ -50,6 +55,16 @@ def parse_gallery_target(raw: str) -> GalleryTarget:
     if "://" not in value:
         return GalleryTarget(username=value)
 
+    match = _GALLERY_URL_RE.match(value)
+    if match:
+        username, folder_ref, folder_slug = match.groups()
+        return GalleryTarget(
+            username=username,
+            folder_ref=folder_ref,
+            folder_slug=folder_slug.strip().lower() if folder_slug else None,
+        )
+
+    # Uncommon shapes (extra segments, other schemes) and the error messages.
     parsed = urlparse(value)
     parts = [part for part in parsed.path.split("/") if part]
 
@@ -79,17 +94,17 @@ def parse_gallery_results(payload: dict[str, object]) -> list[DeviationSummary]:
     for entry in raw_results:
         if not isinstance(entry, dict):
             continue
-        entry_dict = cast(dict[str, object], entry)
-        deviation_id = str(entry_dict.get("deviationid") or "").strip()
-        title = str(entry_dict.get("title") or "").strip()
-        url = str(entry_dict.get("url") or "").strip()
-        kind = str(entry_dict.get("type") or "").strip().lower()
-        if not kind and isinstance(entry_dict.get("text_content"), dict):
-            kind = "literature"
-        if not kind:
-            kind = "unknown"
-        if not deviation_id or not title or not url:
+        get = cast(dict[str, object], entry).get
+        deviation_id = str(get("deviationid") or "").strip()
+        if not deviation_id:
             continue
+        title = str(get("title") or "").strip()
+        url = str(get("url") or "").strip()
+        if not title or not url:
+            continue
+        kind = str(get("type") or "").strip().lower()
+        if not kind:
+            kind = "literature" if isinstance(get("text_content"), dict) else "unknown"
         items.append(
             DeviationSummary(
                 deviation_id=deviation_id,
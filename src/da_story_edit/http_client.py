@@ -3,6 +3,7 @@ from __future__ import annotations
 import random
 import time
 from dataclasses import dataclass
+from typing import Self
 
 import httpx
 
@@ -18,6 +19,12 @@ DEFAULT_BROWSER_ACCEPT = (
 DEFAULT_API_ACCEPT = "application/json"
 DEFAULT_ACCEPT_LANGUAGE = "en-US,en;q=0.9"
 DEFAULT_ACCEPT_ENCODING = "gzip, deflate"
+# Sized for the bounded fan-out of download fetches; idle sockets are kept
+# for 30s so the throttled gaps between requests don't force reconnects.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+DEFAULT_CONNECT_RETRIES = 2
 
 
 @dataclass(frozen=True)
@@ -33,17 +40,51 @@ BROWSER_PROFILE = RequestProfile(
 
 
 class ThrottledHttpClient:
-    """httpx wrapper with randomized pre-request delay and shared headers."""
+    """httpx wrapper with randomized pre-request delay and shared headers.
+
+    A single pooled httpx.Client is created on first use and reused for every
+    request, so consecutive calls share keep-alive TCP/TLS connections.
+    """
 
     def __init__(
         self,
         user_agent: str = DEFAULT_USER_AGENT,
         min_delay_seconds: float = 0.2,
         max_delay_seconds: float = 1.2,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         self.user_agent = user_agent
         self.min_delay_seconds = min_delay_seconds
         self.max_delay_seconds = max_delay_seconds
+        self._transport = transport
+        self._client: httpx.Client | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            # Retries only cover connection setup (connect errors/timeouts),
+            # so they are safe for non-idempotent POSTs as well.
+            transport = self._transport or httpx.HTTPTransport(
+                limits=DEFAULT_LIMITS, retries=DEFAULT_CONNECT_RETRIES
+            )
+            self._client = httpx.Client(
+                headers={
+                    "User-Agent": self.user_agent,
+                    "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+                },
+                transport=transport,
+            )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     def _delay(self) -> None:
         pause = random.uniform(self.min_delay_seconds, self.max_delay_seconds)
@@ -54,11 +95,9 @@ class ThrottledHttpClient:
         profile: RequestProfile,
         extra_headers: dict[str, str] | None = None,
     ) -> dict[str, str]:
-        headers = {
-            "User-Agent": self.user_agent,
-            "Accept": profile.accept,
-            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
-        }
+        # User-Agent and Accept-Encoding are defaults on the pooled client;
+        # httpx merges these profile-specific headers over them per request.
+        headers = {"Accept": profile.accept}
         if profile.include_accept_language:
             headers["Accept-Language"] = DEFAULT_ACCEPT_LANGUAGE
         if extra_headers:
@@ -93,7 +132,7 @@ class ThrottledHttpClient:
     ) -> httpx.Response:
         self._delay()
         headers = self._build_headers(profile)
-        return httpx.get(
+        return self._get_client().get(
             url,
             params=self._normalize_values(params),
             headers=headers,
@@ -112,7 +151,7 @@ class ThrottledHttpClient:
     ) -> httpx.Response:
         self._delay()
         headers = self._build_headers(profile)
-        return httpx.post(
+        return self._get_client().post(
             url,
             data=self._normalize_values(data),
             headers=headers,
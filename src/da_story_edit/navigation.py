@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
 TOP_START = "<!-- DA-STORY-EDIT:NAV:TOP:START -->"
@@ -7,6 +8,23 @@ TOP_END = "<!-- DA-STORY-EDIT:NAV:TOP:END -->"
 BOTTOM_START = "<!-- DA-STORY-EDIT:NAV:BOTTOM:START -->"
 BOTTOM_END = "<!-- DA-STORY-EDIT:NAV:BOTTOM:END -->"
 
+_NAV_LABELS = ("first", "prev", "next", "last")
+
+# Text before and after the links paragraph of each managed block.
+_NAV_TEMPLATES: dict[str, tuple[str, str]] = {
+    "top": (f"{TOP_START}\n<p>", f"</p>\n{TOP_END}"),
+    "bottom": (f"{BOTTOM_START}\n<p>", f"</p>\n{BOTTOM_END}"),
+}
+
+_TOP_BLOCK_RE = re.compile(re.escape(TOP_START) + ".*?" + re.escape(TOP_END), re.DOTALL)
+_BOTTOM_BLOCK_RE = re.compile(
+    re.escape(BOTTOM_START) + ".*?" + re.escape(BOTTOM_END), re.DOTALL
+)
+# Both block kinds in one alternation, for a single scan of well-formed bodies.
+_NAV_BLOCK_RE = re.compile(
+    f"{_TOP_BLOCK_RE.pattern}|{_BOTTOM_BLOCK_RE.pattern}", re.DOTALL
+)
+
 
 @dataclass(frozen=True)
 class NavTargets:
@@ -16,56 +34,90 @@ class NavTargets:
     last: str
 
 
-def _link(label: str, url: str | None) -> str:
-    if not url:
-        return label
-    return f'<a href="{url}">{label}</a>'
+def build_nav_targets(urls: list[str]) -> list[NavTargets]:
+    """Map each URL in sequence order to its first/prev/next/last targets."""
+    if not urls:
+        return []
+    first, last = urls[0], urls[-1]
+    count = len(urls)
+    return [
+        NavTargets(
+            first=first,
+            prev=urls[idx - 1] if idx > 0 else None,
+            next=urls[idx + 1] if idx + 1 < count else None,
+            last=last,
+        )
+        for idx in range(count)
+    ]
+
+
+def _render_links(targets: NavTargets) -> str:
+    urls = (targets.first, targets.prev, targets.next, targets.last)
+    return " | ".join(
+        [
+            f'<a href="{url}">{label}</a>' if url else label
+            for label, url in zip(_NAV_LABELS, urls)
+        ]
+    )
 
 
 def render_nav_block(position: str, targets: NavTargets) -> str:
-    if position not in {"top", "bottom"}:
-        raise ValueError("position must be 'top' or 'bottom'")
+    try:
+        prefix, suffix = _NAV_TEMPLATES[position]
+    except KeyError:
+        raise ValueError("position must be 'top' or 'bottom'") from None
+    return f"{prefix}{_render_links(targets)}{suffix}"
+
+
+def _strip_block(body: str, start: str, block_re: re.Pattern[str]) -> str:
+    current = block_re.sub("", body)
+    if start in current:
+        # Malformed managed block: strip from start marker onward.
+        current = current.partition(start)[0]
+    return current
 
-    start = TOP_START if position == "top" else BOTTOM_START
-    end = TOP_END if position == "top" else BOTTOM_END
 
-    links = " | ".join(
-        [
-            _link("first", targets.first),
-            _link("prev", targets.prev),
-            _link("next", targets.next),
-            _link("last", targets.last),
-        ]
-    )
-    return f"{start}\n<p>{links}</p>\n{end}"
-
-
-def _strip_block(body: str, start: str, end: str) -> str:
-    current = body
-    while True:
-        start_idx = current.find(start)
-        if start_idx == -1:
-            break
-        end_idx = current.find(end, start_idx)
-        if end_idx == -1:
-            # Malformed managed block: strip from start marker onward.
-            current = current[:start_idx].rstrip()
-            break
-        end_idx += len(end)
-        current = (current[:start_idx] + current[end_idx:]).strip()
-    return current
+def _strip_single_blocks(body: str) -> str | None:
+    """Remove at most one well-formed block of each kind with plain scans.
+
+    Returns None when a block is unterminated or contains another start
+    marker, leaving those cases to the regex path.
+    """
+    for start, end in ((TOP_START, TOP_END), (BOTTOM_START, BOTTOM_END)):
+        head, sep, rest = body.partition(start)
+        if not sep:
+            continue
+        block, sep, tail = rest.partition(end)
+        if not sep or TOP_START in block or BOTTOM_START in block:
+            return None
+        body = head + tail
+    return body
 
 
 def strip_managed_navigation(body: str) -> str:
-    stripped = _strip_block(body, TOP_START, TOP_END)
-    stripped = _strip_block(stripped, BOTTOM_START, BOTTOM_END)
+    start_count = body.count(TOP_START), body.count(BOTTOM_START)
+    if max(start_count) <= 1:
+        # Common case: one block of each kind. Skip the regex machinery.
+        stripped = _strip_single_blocks(body)
+        if stripped is not None:
+            return stripped.strip()
+
+    stripped, removed = _NAV_BLOCK_RE.subn("", body)
+    if removed != sum(start_count):
+        # Unterminated or nested markers: top blocks take precedence.
+        stripped = _strip_block(body, TOP_START, _TOP_BLOCK_RE)
+        stripped = _strip_block(stripped, BOTTOM_START, _BOTTOM_BLOCK_RE)
     return stripped.strip()
 
 
 def apply_navigation(body: str, targets: NavTargets) -> str:
     core = strip_managed_navigation(body)
-    top = render_nav_block("top", targets)
-    bottom = render_nav_block("bottom", targets)
-    if core:
-        return f"{top}\n\n{core}\n\n{bottom}\n"
-    return f"{top}\n\n{bottom}\n"
+    # Both blocks carry the same links paragraph; render it once.
+    links = _render_links(targets)
+    top_prefix, top_suffix = _NAV_TEMPLATES["top"]
+    bottom_prefix, bottom_suffix = _NAV_TEMPLATES["bottom"]
+    top = f"{top_prefix}{links}{top_suffix}"
+    # The trailing newline goes on the short bottom block so the long body is
+    # copied only once, by join().
+    bottom = f"{bottom_prefix}{links}{bottom_suffix}\n"
+    return "\n\n".join((top, core, bottom) if core else (top, bottom))
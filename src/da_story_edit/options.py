@@ -1,9 +1,58 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 
 
+def _positive_int(value: str) -> int:
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected an integer, got {value!r}"
+        ) from None
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"expected a value >= 1, got {parsed}")
+    return parsed
+
+
+def _add_gallery_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "gallery",
+        help="Gallery URL (preferred) or DeviantArt username.",
+    )
+    parser.add_argument(
+        "--refresh-folders",
+        action="store_true",
+        help="Ignore the cached folder list and fetch it again from the API.",
+    )
+
+
+def _add_order_arguments(parser: argparse.ArgumentParser) -> None:
+    order_group = parser.add_mutually_exclusive_group()
+    order_group.add_argument(
+        "--ascending",
+        action="store_const",
+        const="ascending",
+        dest="order",
+        help="Keep gallery order as shown on DeviantArt (manual order).",
+    )
+    order_group.add_argument(
+        "--descending",
+        action="store_const",
+        const="descending",
+        dest="order",
+        help="Reverse gallery order (useful when chapters were posted over time).",
+    )
+    parser.set_defaults(order="descending")
+
+
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    """Return the CLI parser, built once per process.
+
+    The instance is shared; callers must not add arguments or defaults to it.
+    """
     parser = argparse.ArgumentParser(
         prog="da-story-edit",
         description="DeviantArt literature navigation editor.",
@@ -57,61 +106,36 @@ def build_parser() -> argparse.ArgumentParser:
         "list",
         help="List deviations for a gallery URL or username.",
     )
-    gallery_list.add_argument(
-        "gallery",
-        help="Gallery URL (preferred) or DeviantArt username.",
-    )
+    _add_gallery_arguments(gallery_list)
     gallery_list.add_argument(
         "--literature-only",
         action="store_true",
         help="Show only literature deviations.",
     )
-    order_group = gallery_list.add_mutually_exclusive_group()
-    order_group.add_argument(
-        "--ascending",
-        action="store_const",
-        const="ascending",
-        dest="order",
-        help="Keep gallery order as shown on DeviantArt (manual order).",
-    )
-    order_group.add_argument(
-        "--descending",
-        action="store_const",
-        const="descending",
-        dest="order",
-        help="Reverse gallery order (useful when chapters were posted over time).",
-    )
-    gallery_list.set_defaults(order="descending")
+    _add_order_arguments(gallery_list)
 
     gallery_download = gallery_subparsers.add_parser(
         "download",
         help="Download literature deviations and store gallery artifacts locally.",
     )
-    gallery_download.add_argument(
-        "gallery",
-        help="Gallery URL (preferred) or DeviantArt username.",
-    )
+    _add_gallery_arguments(gallery_download)
     gallery_download.add_argument(
         "--workdir",
         default=None,
         help="Working directory for downloaded files (must be empty if existing).",
     )
-    download_order = gallery_download.add_mutually_exclusive_group()
-    download_order.add_argument(
-        "--ascending",
-        action="store_const",
-        const="ascending",
-        dest="order",
-        help="Keep gallery order as shown on DeviantArt (manual order).",
+    gallery_download.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented *_meta.json files instead of compact JSON.",
     )
-    download_order.add_argument(
-        "--descending",
-        action="store_const",
-        const="descending",
-        dest="order",
-        help="Reverse gallery order (useful when chapters were posted over time).",
+    gallery_download.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=4,
+        help="Number of deviations to fetch concurrently (default: 4).",
     )
-    gallery_download.set_defaults(order="descending")
+    _add_order_arguments(gallery_download)
 
     gallery_link = gallery_subparsers.add_parser(
         "link",
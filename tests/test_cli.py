@@ -1,4 +1,24 @@
-from da_story_edit.cli import _html_from_fulltext_markup
+import json
+from difflib import unified_diff
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from da_story_edit.cli import (
+    _atomic_write_text,
+    _dump_metadata,
+    _ensure_empty_workdir,
+    _fetch_fulltext_metadata,
+    _find_folder_by_slug,
+    _html_from_fulltext_markup,
+    _write_diff,
+    run,
+)
+from da_story_edit.config import ConfigError
+from da_story_edit.da_api import DeviantArtApiClient, GalleryFolder
+from da_story_edit.gallery import DeviationSummary
+from da_story_edit.navigation import NavTargets, apply_navigation
 
 
 def test_html_from_fulltext_markup_renders_blocks() -> None:
@@ -34,3 +54,114 @@ def test_html_from_fulltext_markup_returns_empty_without_blocks() -> None:
     html = _html_from_fulltext_markup(payload)
 
     assert html == ""
+
+
+class _FakeDeviationClient:
+    def get_deviation(
+        self, deviation_id: str, *, expand: str | None = None
+    ) -> dict[str, object]:
+        if deviation_id == "bad":
+            raise ConfigError("boom")
+        return {"deviationid": deviation_id, "expand": expand}
+
+
+def test_fetch_fulltext_metadata_keeps_order_and_reports_failures() -> None:
+    items = [
+        DeviationSummary(deviation_id=ref, title=ref, url=f"u/{ref}", kind="literature")
+        for ref in ["a", "bad", "c", "d"]
+    ]
+    client = cast(DeviantArtApiClient, _FakeDeviationClient())
+
+    results = list(_fetch_fulltext_metadata(client, items, jobs=3))
+
+    assert [r["deviationid"] for r in results if isinstance(r, dict)] == [
+        "a",
+        "c",
+        "d",
+    ]
+    assert isinstance(results[1], ConfigError)
+    assert isinstance(results[0], dict)
+    assert results[0]["expand"] == "deviation.fulltext"
+
+
+def test_write_diff_streams_unified_diff_lines(tmp_path: Path) -> None:
+    original = ["<p>a</p>", "<p>b</p>"]
+    updated = ["<nav/>", "<p>a</p>", "<p>b</p>"]
+    diff_path = tmp_path / "001.diff"
+
+    _write_diff(diff_path, original, updated, fromfile="old", tofile="new")
+
+    expected = "\n".join(
+        unified_diff(original, updated, fromfile="old", tofile="new", lineterm="")
+    )
+    assert diff_path.read_text(encoding="utf-8") == expected + "\n"
+
+
+def test_write_diff_writes_empty_file_without_changes(tmp_path: Path) -> None:
+    diff_path = tmp_path / "001.diff"
+
+    _write_diff(diff_path, ["<p>a</p>"], ["<p>a</p>"], fromfile="old", tofile="new")
+
+    assert diff_path.read_text(encoding="utf-8") == ""
+
+
+def test_atomic_write_text_replaces_target_without_leftovers(tmp_path: Path) -> None:
+    target = tmp_path / "001_original.html"
+    target.write_text("old", encoding="utf-8")
+
+    _atomic_write_text(target, "<p>new</p>")
+
+    assert target.read_text(encoding="utf-8") == "<p>new</p>"
+    assert [path.name for path in tmp_path.iterdir()] == ["001_original.html"]
+
+
+def test_find_folder_by_slug_matches_slugified_names() -> None:
+    folders = [GalleryFolder("A", "Alpha"), GalleryFolder("B", "Test Gallery")]
+
+    assert _find_folder_by_slug(folders, "testgallery") == folders[1]
+    assert _find_folder_by_slug(folders, "missing") is None
+
+
+def test_gallery_link_writes_artifacts_only_for_changed_items(tmp_path: Path) -> None:
+    urls = ["https://example.com/1", "https://example.com/2"]
+    already_linked = apply_navigation(
+        "<p>two</p>", NavTargets(first=urls[0], prev=urls[0], next=None, last=urls[1])
+    )
+    (tmp_path / "001_a_original.html").write_text("<p>one</p>", encoding="utf-8")
+    (tmp_path / "002_b_original.html").write_text(already_linked, encoding="utf-8")
+    (tmp_path / "002_b_updated.html").write_text("stale", encoding="utf-8")
+    manifest = {
+        "items": [
+            {"deviation_id": "a", "title": "One", "url": urls[0], "base_name": "001_a"},
+            {"deviation_id": "b", "title": "Two", "url": urls[1], "base_name": "002_b"},
+        ]
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+    assert run(["gallery", "link", str(tmp_path)]) == 0
+
+    assert (tmp_path / "001_a_updated.html").exists()
+    assert (tmp_path / "001_a.diff").read_text(encoding="utf-8")
+    assert not (tmp_path / "002_b_updated.html").exists()
+    assert not (tmp_path / "002_b.diff").exists()
+    assert "linked_at" in json.loads((tmp_path / "manifest.json").read_text())
+
+
+def test_dump_metadata_is_compact_unless_pretty() -> None:
+    metadata: dict[str, object] = {"title": "T", "is_mature": False}
+
+    assert _dump_metadata(metadata, pretty=False) == '{"is_mature":false,"title":"T"}'
+    assert json.loads(_dump_metadata(metadata, pretty=True)) == metadata
+    assert "\n  " in _dump_metadata(metadata, pretty=True)
+
+
+def test_ensure_empty_workdir_accepts_empty_and_rejects_populated(
+    tmp_path: Path,
+) -> None:
+    created = _ensure_empty_workdir(tmp_path / "new" / "gallery")
+    assert created.is_dir()
+    assert _ensure_empty_workdir(created) == created
+
+    (created / "manifest.json").write_text("{}", encoding="utf-8")
+    with pytest.raises(ConfigError, match="Workdir must be empty"):
+        _ensure_empty_workdir(created)
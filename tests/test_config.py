@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 
+from da_story_edit import config
 from da_story_edit.config import (
     CONFIG_REGISTRY,
     ConfigError,
@@ -90,3 +91,85 @@ def test_upsert_env_values_updates_existing_and_appends_new(tmp_path: Path) -> N
     assert "DA_CLIENT_ID=old" not in content
     assert "DA_REDIRECT_URI=uri" in content
     assert "DA_REFRESH_TOKEN=rtok" in content
+
+
+def test_env_file_parse_is_cached_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    env_path = tmp_path / ".env"
+    _write_env(env_path, {"DA_CLIENT_ID": "old"})
+    parse_calls: list[Path] = []
+    real_parse = config._parse_env_file
+
+    def counting_parse(path: Path) -> dict[str, str]:
+        parse_calls.append(path)
+        return real_parse(path)
+
+    monkeypatch.setattr(config, "_parse_env_file", counting_parse)
+
+    assert config._read_env_file(env_path)["DA_CLIENT_ID"] == "old"
+    assert config._read_env_file(env_path)["DA_CLIENT_ID"] == "old"
+    assert len(parse_calls) == 1
+
+    upsert_env_values(env_path, {"DA_CLIENT_ID": "new"})
+
+    assert config._read_env_file(env_path)["DA_CLIENT_ID"] == "new"
+    assert len(parse_calls) == 2
+
+
+def test_resolve_skips_bootstrap_while_env_file_is_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    env_path = tmp_path / ".env"
+    _write_env(env_path, _all_required_values())
+    bootstrap_calls: list[Path] = []
+    real_bootstrap = config.bootstrap_env_file
+
+    def counting_bootstrap(path: Path) -> list[str]:
+        bootstrap_calls.append(path)
+        return real_bootstrap(path)
+
+    monkeypatch.setattr(config, "bootstrap_env_file", counting_bootstrap)
+
+    load_and_validate_config(env_path)
+    load_and_validate_config(env_path)
+    assert len(bootstrap_calls) == 1
+
+    upsert_env_values(env_path, {"DA_CLIENT_ID": "changed"})
+    load_and_validate_config(env_path)
+    assert len(bootstrap_calls) == 2
+
+
+def test_parse_env_file_handles_comments_quotes_and_bare_keys(tmp_path: Path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        "# comment\n"
+        "\n"
+        "DA_CLIENT_ID=123\n"
+        "DA_CLIENT_SECRET = 'se=cret'\n"
+        'DA_REDIRECT_URI="http://localhost:8765/callback"\n'
+        "DA_REFRESH_TOKEN=\n"
+        "not a pair\n",
+        encoding="utf-8",
+    )
+
+    assert config._parse_env_file(env_path) == {
+        "DA_CLIENT_ID": "123",
+        "DA_CLIENT_SECRET": "se=cret",
+        "DA_REDIRECT_URI": "http://localhost:8765/callback",
+        "DA_REFRESH_TOKEN": "",
+    }
+
+
+def test_upsert_env_values_on_missing_file_matches_bootstrap_then_upsert(
+    tmp_path: Path,
+) -> None:
+    bootstrapped = tmp_path / "bootstrapped.env"
+    bootstrap_env_file(bootstrapped)
+    upsert_env_values(bootstrapped, {"DA_ACCESS_TOKEN": "tok"})
+    fresh = tmp_path / "fresh.env"
+
+    upsert_env_values(fresh, {"DA_ACCESS_TOKEN": "tok"})
+
+    assert fresh.read_text(encoding="utf-8") == bootstrapped.read_text(encoding="utf-8")
+    assert "DA_ACCESS_TOKEN=tok" in fresh.read_text(encoding="utf-8")
@@ -5,7 +5,7 @@ from typing import cast
 
 import httpx
 
-from da_story_edit.da_api import DeviantArtApiClient
+from da_story_edit.da_api import DeviantArtApiClient, looks_like_invalid_token
 from da_story_edit.http_client import ThrottledHttpClient
 
 
@@ -122,3 +122,111 @@ def test_list_gallery_includes_mode_newest_parameter() -> None:
     _, params = gallery_calls[0]
     assert params is not None
     assert params["mode"] == "newest"
+
+
+def test_close_leaves_shared_http_client_open() -> None:
+    shared = ThrottledHttpClient(user_agent="ua")
+    shared_pool = shared._get_client()
+
+    with DeviantArtApiClient(access_token="token", user_agent="ua", http_client=shared):
+        pass
+
+    assert not shared_pool.is_closed
+    shared.close()
+
+
+def test_close_releases_owned_http_client() -> None:
+    with DeviantArtApiClient(access_token="token", user_agent="ua") as client:
+        owned_pool = client.http_client._get_client()
+
+    assert owned_pool.is_closed
+
+
+class _PagedGalleryHttpClient:
+    """Serves `total` gallery entries; next_offset follows `step` per page."""
+
+    def __init__(self, total: int, step: int) -> None:
+        self.total = total
+        self.step = step
+        self.offsets: list[int] = []
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: dict[str, object] | None = None,
+        profile: object = None,
+        follow_redirects: bool = False,
+        timeout: float = 30.0,
+    ) -> _FakeResponse:
+        del url, profile, follow_redirects, timeout
+        assert params is not None
+        offset = cast(int, params["offset"])
+        self.offsets.append(offset)
+        end = min(offset + self.step, self.total)
+        results = [
+            {
+                "deviationid": f"uuid-{idx}",
+                "title": f"Title {idx}",
+                "url": f"https://www.deviantart.com/a/art/{idx}",
+                "type": "literature",
+            }
+            for idx in range(offset, end)
+        ]
+        has_more = end < self.total
+        return _FakeResponse(
+            {
+                "results": results,
+                "has_more": has_more,
+                "next_offset": end if has_more else None,
+            }
+        )
+
+
+def test_list_gallery_fetches_pages_concurrently_in_order() -> None:
+    fake = _PagedGalleryHttpClient(total=24 * 5 + 3, step=24)
+    client = DeviantArtApiClient(
+        access_token="token",
+        user_agent="ua",
+        http_client=cast(ThrottledHttpClient, fake),
+        page_workers=4,
+    )
+
+    items = client.list_gallery("zoec98")
+
+    assert [item.deviation_id for item in items] == [
+        f"uuid-{idx}" for idx in range(24 * 5 + 3)
+    ]
+    assert sorted(set(fake.offsets))[:6] == [0, 24, 48, 72, 96, 120]
+
+
+def test_list_gallery_resumes_when_server_pages_differently() -> None:
+    fake = _PagedGalleryHttpClient(total=25, step=10)
+    client = DeviantArtApiClient(
+        access_token="token",
+        user_agent="ua",
+        http_client=cast(ThrottledHttpClient, fake),
+        page_workers=3,
+    )
+
+    items = client.list_gallery("zoec98")
+
+    assert [item.deviation_id for item in items] == [f"uuid-{idx}" for idx in range(25)]
+
+
+def test_looks_like_invalid_token_reads_json_error_fields() -> None:
+    expired = httpx.Response(
+        401, json={"error": "invalid_token", "error_description": "Expired."}
+    )
+    other = httpx.Response(403, json={"error": "insufficient_scope"})
+    not_auth = httpx.Response(500, json={"error": "invalid_token"})
+
+    assert looks_like_invalid_token(expired) is True
+    assert looks_like_invalid_token(other) is False
+    assert looks_like_invalid_token(not_auth) is False
+
+
+def test_looks_like_invalid_token_scans_start_of_non_json_body() -> None:
+    assert looks_like_invalid_token(httpx.Response(401, text="Token expired"))
+    buried = "x" * 1000 + "invalid_token"
+    assert not looks_like_invalid_token(httpx.Response(401, text=buried))
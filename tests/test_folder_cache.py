@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from da_story_edit.da_api import GalleryFolder
+from da_story_edit.folder_cache import load_cached_folders, store_cached_folders
+
+
+def test_store_and_load_cached_folders_round_trip(tmp_path: Path) -> None:
+    folders = [GalleryFolder("A", "Alpha"), GalleryFolder("B", "Beta")]
+
+    store_cached_folders(tmp_path, "ZoeC98", folders, now=1000.0)
+
+    assert load_cached_folders(tmp_path, "zoec98", now=1010.0) == folders
+
+
+def test_load_cached_folders_ignores_stale_entries(tmp_path: Path) -> None:
+    store_cached_folders(tmp_path, "zoec98", [GalleryFolder("A", "Alpha")], now=0.0)
+
+    assert load_cached_folders(tmp_path, "zoec98", max_age_seconds=60, now=61.0) is None
+
+
+def test_load_cached_folders_treats_invalid_files_as_miss(tmp_path: Path) -> None:
+    (tmp_path / "zoec98.json").write_text("{not json", encoding="utf-8")
+
+    assert load_cached_folders(tmp_path, "zoec98") is None
+    assert load_cached_folders(tmp_path, "someone-else") is None
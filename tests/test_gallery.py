@@ -27,6 +27,20 @@ def test_parse_gallery_target_from_uuid_folder_url() -> None:
     assert target.folder_slug == "featured"
 
 
+def test_parse_gallery_target_ignores_trailing_slash_and_query() -> None:
+    target = parse_gallery_target(
+        "https://www.deviantart.com/zoec98/gallery/100193480/TestGallery/?view=1"
+    )
+    assert target.username == "zoec98"
+    assert target.folder_ref == "100193480"
+    assert target.folder_slug == "testgallery"
+
+
+def test_parse_gallery_target_rejects_non_gallery_path() -> None:
+    with pytest.raises(ConfigError, match="/<user>/gallery/"):
+        parse_gallery_target("https://www.deviantart.com/zoec98/art/some-story-123")
+
+
 def test_parse_gallery_target_from_username() -> None:
     target = parse_gallery_target("zoec98")
     assert target.username == "zoec98"
@@ -64,6 +78,7 @@ def test_parse_gallery_results_extracts_valid_entries() -> None:
 
 def test_slugify_name_matches_gallery_slug_style() -> None:
     assert slugify_name("Test Gallery") == "testgallery"
+    assert slugify_name("Café No. 2 — Drafts!") == "cafeno2drafts"
 
 
 def test_extract_gallery_deviation_urls_preserves_order_and_deduplicates() -> None:
@@ -77,3 +92,12 @@ def test_extract_gallery_deviation_urls_preserves_order_and_deduplicates() -> No
         "https://www.deviantart.com/zoec98/art/A-1",
         "https://www.deviantart.com/zoec98/art/B-2",
     ]
+
+
+def test_extract_gallery_deviation_urls_filters_by_username() -> None:
+    html = """
+    <a href="https://www.deviantart.com/ZoeC98/art/A-1"></a>
+    <a href="https://www.deviantart.com/someone/art/B-2"></a>
+    """
+    urls = extract_gallery_deviation_urls(html, "zoec98")
+    assert urls == ["https://www.deviantart.com/ZoeC98/art/A-1"]
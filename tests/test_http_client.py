@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import httpx
+
+from da_story_edit.http_client import (
+    API_PROFILE,
+    BROWSER_PROFILE,
+    ThrottledHttpClient,
+)
+
+
+def _client(handler: httpx.MockTransport) -> ThrottledHttpClient:
+    return ThrottledHttpClient(
+        user_agent="ua",
+        min_delay_seconds=0.0,
+        max_delay_seconds=0.0,
+        transport=handler,
+    )
+
+
+def test_throttled_client_reuses_pooled_client_across_requests() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(f"{request.method} {request.headers['User-Agent']}")
+        return httpx.Response(200, json={})
+
+    client = _client(httpx.MockTransport(handler))
+    client.get("https://example.com/a")
+    pooled = client._get_client()
+    client.post("https://example.com/b", data={"x": "1"})
+
+    assert client._get_client() is pooled
+    assert seen == ["GET ua", "POST ua"]
+
+
+def test_throttled_client_close_releases_pooled_client() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+
+    with _client(transport) as client:
+        client.get("https://example.com/a")
+        pooled = client._get_client()
+
+    assert pooled.is_closed
+    assert client._client is None
+
+
+def test_throttled_client_merges_profile_headers_over_client_defaults() -> None:
+    seen: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers)
+        return httpx.Response(200)
+
+    client = _client(httpx.MockTransport(handler))
+    client.get("https://example.com/api", profile=API_PROFILE)
+    client.get("https://example.com/page", profile=BROWSER_PROFILE)
+
+    api_headers, browser_headers = seen
+    assert api_headers["User-Agent"] == "ua"
+    assert api_headers["Accept"] == "application/json"
+    assert "Accept-Language" not in api_headers
+    assert browser_headers["User-Agent"] == "ua"
+    assert browser_headers["Accept"].startswith("text/html")
+    assert "Accept-Language" in browser_headers
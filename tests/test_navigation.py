@@ -1,3 +1,5 @@
+import pytest
+
 from da_story_edit.navigation import (
     BOTTOM_END,
     BOTTOM_START,
@@ -5,6 +7,8 @@ from da_story_edit.navigation import (
     TOP_START,
     NavTargets,
     apply_navigation,
+    build_nav_targets,
+    render_nav_block,
     strip_managed_navigation,
 )
 
@@ -27,6 +31,31 @@ def test_apply_navigation_inserts_top_and_bottom_blocks() -> None:
     assert "<p>Hello world</p>" in updated
 
 
+def test_apply_navigation_replaces_blocks_and_keeps_core() -> None:
+    targets = NavTargets(first="u1", prev=None, next=None, last="u1")
+    top = render_nav_block("top", targets)
+    bottom = render_nav_block("bottom", targets)
+
+    once = apply_navigation("<p>body</p>", targets)
+
+    assert once == f"{top}\n\n<p>body</p>\n\n{bottom}\n"
+    assert apply_navigation(once, targets) == once
+    assert apply_navigation("", targets) == f"{top}\n\n{bottom}\n"
+
+
+def test_render_nav_block_links_available_targets() -> None:
+    targets = NavTargets(first="u1", prev=None, next="u2", last="u3")
+
+    assert render_nav_block("bottom", targets) == (
+        f"{BOTTOM_START}\n"
+        '<p><a href="u1">first</a> | prev | <a href="u2">next</a> | '
+        '<a href="u3">last</a></p>\n'
+        f"{BOTTOM_END}"
+    )
+    with pytest.raises(ValueError):
+        render_nav_block("middle", targets)
+
+
 def test_strip_managed_navigation_removes_existing_blocks() -> None:
     body = (
         f"{TOP_START}\n<p>old</p>\n{TOP_END}\n\n"
@@ -35,3 +64,32 @@ def test_strip_managed_navigation_removes_existing_blocks() -> None:
     )
     stripped = strip_managed_navigation(body)
     assert stripped == "<p>content</p>"
+
+
+def test_strip_managed_navigation_truncates_unterminated_block() -> None:
+    body = (
+        f"{TOP_START}\n<p>old</p>\n{TOP_END}\n\n"
+        "<p>content</p>\n\n"
+        f"{BOTTOM_START}\n<p>old</p>\n\n<p>trailing</p>\n"
+    )
+    assert strip_managed_navigation(body) == "<p>content</p>"
+
+
+def test_strip_managed_navigation_removes_repeated_blocks() -> None:
+    block = f"{TOP_START}\n<p>old</p>\n{TOP_END}"
+    body = f"{block}\n\n<p>one</p>\n\n{block}\n\n<p>two</p>"
+    assert strip_managed_navigation(body) == "<p>one</p>\n\n\n\n<p>two</p>"
+
+
+def test_build_nav_targets_maps_first_prev_next_last() -> None:
+    targets = build_nav_targets(["u1", "u2", "u3"])
+
+    assert targets == [
+        NavTargets(first="u1", prev=None, next="u2", last="u3"),
+        NavTargets(first="u1", prev="u1", next="u3", last="u3"),
+        NavTargets(first="u1", prev="u2", next=None, last="u3"),
+    ]
+    assert build_nav_targets(["solo"]) == [
+        NavTargets(first="solo", prev=None, next=None, last="solo")
+    ]
+    assert build_nav_targets([]) == []
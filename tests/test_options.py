@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from da_story_edit.cli import _build_authorize_url, _default_gallery_workdir
 from da_story_edit.options import build_parser
 
@@ -94,3 +96,38 @@ def test_default_gallery_workdir_slugifies_label() -> None:
     assert _default_gallery_workdir("Horse Stories") == Path(
         "galleries/horse-stories"
     )
+
+
+def test_build_parser_gallery_download_jobs_defaults_and_override() -> None:
+    parser = build_parser()
+
+    assert parser.parse_args(["gallery", "download", "zoec98"]).jobs == 4
+    args = parser.parse_args(["gallery", "download", "zoec98", "--jobs", "8"])
+    assert args.jobs == 8
+
+
+def test_build_parser_gallery_download_rejects_non_positive_jobs() -> None:
+    parser = build_parser()
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["gallery", "download", "zoec98", "--jobs", "0"])
+
+
+def test_build_parser_gallery_commands_accept_refresh_folders() -> None:
+    parser = build_parser()
+
+    assert parser.parse_args(["gallery", "list", "zoec98"]).refresh_folders is False
+    args = parser.parse_args(["gallery", "download", "zoec98", "--refresh-folders"])
+    assert args.refresh_folders is True
+
+
+def test_build_parser_gallery_download_pretty_flag() -> None:
+    parser = build_parser()
+
+    assert parser.parse_args(["gallery", "download", "zoec98"]).pretty is False
+    args = parser.parse_args(["gallery", "download", "zoec98", "--pretty"])
+    assert args.pretty is True
+
+
+def test_build_parser_returns_shared_instance() -> None:
+    assert build_parser() is build_parser()